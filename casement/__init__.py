@@ -1,2 +1,28 @@
-__all__ = ["__version__"]
+__all__ = ["__version__", "AppId", "EnvVar", "FlashTimes", "RegKey", "Shortcut"]
 from .version import version as __version__
+
+
+def __getattr__(name):
+    # PEP 562 lazy re-exports. `import casement` stays cheap and the pywin32
+    # backed modules are only loaded when their classes are first accessed.
+    if name == "AppId":
+        from .app_id import AppId
+
+        return AppId
+    if name == "EnvVar":
+        from .env_var import EnvVar
+
+        return EnvVar
+    if name == "FlashTimes":
+        from .enums import FlashTimes
+
+        return FlashTimes
+    if name == "RegKey":
+        from .registry import RegKey
+
+        return RegKey
+    if name == "Shortcut":
+        from .shortcut import Shortcut
+
+        return Shortcut
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -2,10 +2,6 @@ import ctypes
 import os
 from ctypes import wintypes
 
-import pythoncom
-from win32com.propsys import propsys
-from win32com.shell import shellcon
-
 
 class AppId(object):
     @staticmethod
@@ -17,7 +13,7 @@ class AppId(object):
         app id for a running application.
         """
         if os.path.exists(shortcut):
-            # These imports won't work inside python 2 DCC's
+            # Deferred import, propsys loads a large pywin32 extension
             from win32com.propsys import propsys
 
             # Original info from https://stackoverflow.com/a/61714895
@@ -41,6 +37,12 @@ class AppId(object):
             app_id (str): The app id to set on the shortcut
         """
         if os.path.exists(shortcut):
+            # Deferred imports, propsys and pythoncom load large pywin32
+            # extensions
+            import pythoncom
+            from win32com.propsys import propsys
+            from win32com.shell import shellcon
+
             # Original info from https://stackoverflow.com/a/61714895
             key = propsys.PSGetPropertyKeyFromName("System.AppUserModel.ID")
             store = propsys.SHGetPropertyStoreFromParsingName(
@@ -84,5 +86,5 @@ class AppId(object):
 
         # https://stackoverflow.com/a/27872625
         if prefix:
-            appid = u'%s.%s' % (prefix, appid)
+            appid = f'{prefix}.{appid}'
         return not ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(appid)
@@ -1,8 +1,27 @@
+import functools
 import importlib
 import logging
 import sys
 from argparse import ArgumentParser
 
+# Map of short command names to the full command/submodule names
+_SHORT_NAMES = {
+    'sc': 'shortcut',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cli_module(name):
+    """Resolves the casement submodule implementing a cli command.
+
+    Checks sys.modules first so warm lookups skip the importlib machinery
+    entirely, and caches the result for repeated CasementParser instances.
+    """
+    module = sys.modules.get('casement.{}'.format(name))
+    if module is not None:
+        return module
+    return importlib.import_module('.{}'.format(name), package='casement')
+
 
 class CasementParser(object):
     '''
@@ -39,27 +58,25 @@ class CasementParser(object):
 
     def __init__(self):
         self.target_cli = None
-        self._base_parser = ArgumentParser(
-            description='Windows management tool',
-            usage="casement <command> [<args>]\n\n"
-            "Valid commands are:\n"
-            "    shortcut or sc: Manage windows shortcuts.",
-        )
-        self._base_parser.add_argument('command', help='Command to run')
-        args = self._base_parser.parse_args(sys.argv[1:2])
+        # Sniff the command directly from sys.argv. This defers building the
+        # base ArgumentParser until we actually need to show help/errors, and
+        # only ever imports and builds the parser for the requested command.
+        # The sub-command's parse_args call in `parse_args` is then the only
+        # full argparse pass a normal invocation makes.
+        command = sys.argv[1] if len(sys.argv) > 1 else None
+        if command is None or command.startswith('-'):
+            # No command was passed, or a flag like -h/--help was passed
+            # first. Let the base parser report help or the missing command.
+            # This always exits: with 0 for -h/--help, or 2 for no command.
+            self._base_parser().parse_args(sys.argv[1:2])
 
         # Convert short command names to full command names
-        short_names = {
-            'sc': 'shortcut',
-        }
-        self.command = short_names.get(args.command, args.command)
+        self.command = _SHORT_NAMES.get(command, command)
         # use dispatch pattern to invoke method with same name
         try:
-            module = importlib.import_module(
-                '.{}'.format(self.command), package='casement'
-            )
+            module = _load_cli_module(self.command)
         except ImportError:
-            self._base_parser.print_help()
+            self._base_parser().print_help()
             sys.exit(1)
         # parse_args defaults to [1:] for args, but we need to remove
         # the 2 levels of commands for proper validation
@@ -74,6 +91,17 @@ class CasementParser(object):
                 '-v', '--verbose', action='store_true', help='Give more output.'
             )
 
+    def _base_parser(self):
+        """Builds the top level ArgumentParser used for help and errors."""
+        parser = ArgumentParser(
+            description='Windows management tool',
+            usage="casement <command> [<args>]\n\n"
+            "Valid commands are:\n"
+            "    shortcut or sc: Manage windows shortcuts.",
+        )
+        parser.add_argument('command', help='Command to run')
+        return parser
+
     def parse_args(self):
         """Parse sub-command arguments adding global options."""
         args = self.target_cli.parser.parse_args(self.args_list)
@@ -1,9 +1,12 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class FlashTimes(Enum):
+class FlashTimes(IntEnum):
     """Windows flags for casement.utils.flashWindow().
 
+    Members are plain ints so they can be passed directly to win32 APIs
+    without a `.value` dereference.
+
     https://docs.microsoft.com/en-us/windows/desktop/api/winuser/ns-winuser-flashwinfo
     """
 
@@ -1,19 +1,76 @@
+import ctypes
 import logging
 import os
-from contextlib import contextmanager
-
-import win32api
-import win32con
-import win32file
-import win32gui
-from six.moves import winreg
-from six.moves.collections_abc import MutableMapping
+import winreg
+from collections.abc import MutableMapping
+from ctypes import wintypes
 
 from .registry import REG_LOCATIONS, RegKey
 
 _logger_modify = logging.getLogger(__name__ + ".modify")
 _logger_broadcast = logging.getLogger(__name__ + ".broadcast")
 
+# Constants used for the WM_SETTINGCHANGE broadcast in `EnvVar.broadcast`
+_HWND_BROADCAST = 0xFFFF
+_WM_SETTINGCHANGE = 0x001A
+_SMTO_ABORTIFHUNG = 0x0002
+
+_send_message_timeout = None
+
+
+def _get_send_message_timeout():
+    """Returns user32.SendMessageTimeoutW with its prototype configured.
+
+    Binding this directly with ctypes avoids importing win32gui just to make
+    a single WinAPI call. The function is resolved once on first use.
+    """
+    global _send_message_timeout
+    if _send_message_timeout is None:
+        func = ctypes.windll.user32.SendMessageTimeoutW
+        func.argtypes = [
+            wintypes.HWND,
+            wintypes.UINT,
+            wintypes.WPARAM,
+            wintypes.LPCWSTR,
+            wintypes.UINT,
+            wintypes.UINT,
+            # PDWORD_PTR: pointer-sized out-param, not a 4 byte DWORD
+            ctypes.POINTER(ctypes.c_size_t),
+        ]
+        func.restype = wintypes.LPARAM
+        _send_message_timeout = func
+    return _send_message_timeout
+
+
+class _DelayedBroadcast(object):
+    """Context manager returned by `EnvVar.delayed_broadcast`.
+
+    Implemented as a plain class instead of a generator based contextmanager
+    so each use doesn't allocate a generator frame. `cls` is the EnvVar class
+    (or subclass) whose broadcast state is being managed.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+
+    def __enter__(self):
+        self.current = self.cls._broadcast_enabled
+        self.cls._broadcast_enabled = False
+        # Keep write handles open for the duration of the scope so batched
+        # modifications only open the Environment key once.
+        self._pin = RegKey.pin_write_handles()
+        self._pin.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        cls = self.cls
+        try:
+            self._pin.__exit__(exc_type, exc_value, traceback)
+        finally:
+            cls._broadcast_enabled = self.current
+            if cls._broadcast_required:
+                cls.broadcast()
+
 
 class EnvVar(MutableMapping):
     """A dictionary like mapping of environment variables as defined in the
@@ -47,16 +104,53 @@ class EnvVar(MutableMapping):
     _broadcast_enabled = True
     _broadcast_required = False
 
+    # Cached instances returned by `shared`, keyed by (class, system)
+    _shared_instances = {}
+
     def __init__(self, system=False):
-        key, sub_key = REG_LOCATIONS["system" if system else "user"]['env_var']
-        self.__reg__ = RegKey(key, sub_key)
+        self.__reg__ = REG_LOCATIONS["system" if system else "user"]['env_var'].clone()
+
+    def __bool__(self):
+        # Without this, truthiness checks fall back to __len__ whose
+        # QueryInfoKey call is more expensive than an existence check.
+        return self.__reg__.exists()
+
+    def __contains__(self, key):
+        # MutableMapping's default __contains__ calls __getitem__ and pays for
+        # its KeyError handling. Query the value directly against the cached
+        # handle instead of building a RegEntry just to throw it away.
+        try:
+            winreg.QueryValueEx(self.__reg__._key(), key)
+        except OSError:
+            return False
+        return True
 
     def __delitem__(self, key):
+        cls = type(self)
         entry = self.__reg__.entry(key)
+        _logger_modify.debug('Deleting env var: "%s"', key)
+        if cls._broadcast_enabled is False:
+            # Already inside a delayed_broadcast scope, skip nesting another
+            entry.delete()
+            cls._broadcast_required = True
+            return
+
         with self.delayed_broadcast():
-            _logger_modify.debug('Deleting env var: "{}"'.format(key))
             entry.delete()
-            type(self)._broadcast_required = True
+            cls._broadcast_required = True
+
+    def discard(self, key):
+        """Deletes the environment variable if it is set.
+
+        Unlike ``del``, a missing value is not an error. This skips the
+        separate membership query a ``if key in env: del env[key]`` pattern
+        pays, going straight to the delete and swallowing the failure, and
+        doesn't broadcast when nothing was removed.
+        """
+        try:
+            del self[key]
+        except OSError:
+            pass
 
     def __getitem__(self, key):
         entry = self.__reg__.entry(key)
@@ -77,11 +171,61 @@ class EnvVar(MutableMapping):
         return count
 
     def __setitem__(self, key, value, value_type=winreg.REG_EXPAND_SZ):
+        cls = type(self)
         entry = self.__reg__.entry(key)
+        _logger_modify.debug('Setting env var: "%s" to "%s"', key, value)
+        if cls._broadcast_enabled is False:
+            # Already inside a delayed_broadcast scope, skip nesting another
+            entry.set(value, value_type=value_type)
+            cls._broadcast_required = True
+            return
+
         with self.delayed_broadcast():
-            _logger_modify.debug('Setting env var: "{}" to "{}"'.format(key, value))
             entry.set(value, value_type=value_type)
-            type(self)._broadcast_required = True
+            cls._broadcast_required = True
+
+    def items(self):
+        """Returns (name, value) pairs read using a single open handle.
+
+        `winreg.EnumValue` already returns the stored data, so this skips the
+        extra registry query per key that iterating names and indexing pays.
+        The result is materialized as a list so it can be sized and iterated
+        more than once like the mapping view it replaces.
+        """
+        reg_key = self.__reg__._key()
+        if not reg_key:
+            return []
+
+        _, count, _ = winreg.QueryInfoKey(reg_key)
+        items = []
+        for index in range(count):
+            name, value, _ = winreg.EnumValue(reg_key, index)
+            items.append((name, value))
+        return items
+
+    def values(self):
+        """Returns values read using a single open handle. See `items`."""
+        return [value for _, value in self.items()]
+
+    @classmethod
+    def shared(cls, system=False):
+        """Returns a cached instance for the given scope.
+
+        The instance and the registry handle it holds internally are created
+        once and reused, so callers that don't need an isolated instance
+        amortize the key open across the process. Use the constructor
+        directly if you plan to modify the instance's `__reg__`.
+
+        Arguments:
+            system (bool, optional): Controls if the instance modifies system
+                or user environment variables.
+        """
+        key = (cls, bool(system))
+        instance = cls._shared_instances.get(key)
+        if instance is None:
+            instance = cls(system=system)
+            cls._shared_instances[key] = instance
+        return instance
 
     @classmethod
     def broadcast(cls):
@@ -95,32 +239,26 @@ class EnvVar(MutableMapping):
             return
 
         _logger_broadcast.debug('Broadcasting that the environment was changed')
-        win32gui.SendMessageTimeout(
-            win32con.HWND_BROADCAST,
-            win32con.WM_SETTINGCHANGE,
+        result = ctypes.c_size_t()
+        _get_send_message_timeout()(
+            _HWND_BROADCAST,
+            _WM_SETTINGCHANGE,
             0,
             'Environment',
-            win32con.SMTO_ABORTIFHUNG,
+            _SMTO_ABORTIFHUNG,
             1000,
+            ctypes.byref(result),
         )
         # Reset the needs broadcast variable now that we have broadcast
         cls._broadcast_required = False
 
     @classmethod
-    @contextmanager
     def delayed_broadcast(cls):
         """Context manager that disables broadcast calls for each set/delete of
         environment variables. Only if any set/delete calls were made inside the
         with context, will it call broadcast.
         """
-        try:
-            current = cls._broadcast_enabled
-            cls._broadcast_enabled = False
-            yield
-        finally:
-            cls._broadcast_enabled = current
-            if cls._broadcast_required:
-                cls.broadcast()
+        return _DelayedBroadcast(cls)
 
     @classmethod
     def normalize_path(cls, path, expandvars=True, tilde=None, normpath=True):
@@ -140,10 +278,16 @@ class EnvVar(MutableMapping):
         Raises:
             pywintypes.error: Raised if path doesn't exist when tilde is not None.
         """
-        if tilde:
-            path = win32api.GetShortPathName(path)
-        elif tilde is False:
-            path = win32file.GetLongPathName(path)
+        if tilde is not None:
+            # Deferred import, only the tilde conversions require pywin32
+            if tilde:
+                import win32api
+
+                path = win32api.GetShortPathName(path)
+            else:
+                import win32file
+
+                path = win32file.GetLongPathName(path)
 
         if expandvars:
             path = os.path.expandvars(path)
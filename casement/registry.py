@@ -3,59 +3,75 @@ key: Nodes in tree
 Each node in the tree is called a key.
 Each key can contain both subkeys and data entries called values.
 """
-import six
-from six.moves import winreg
-
-
-def _generate_key_map():
-    """Creates a map of strings to winreg.HKEY_* objects."""
-    key_map = {}
+import errno
+import functools
+from contextlib import contextmanager
+
+import winreg
+
+# Pre-bound winreg functions used on the hot key access/enumeration paths.
+# Binding them once here skips a module attribute lookup per call inside the
+# tight enumeration loops below.
+_CloseKey = winreg.CloseKey
+_ConnectRegistry = winreg.ConnectRegistry
+_EnumKey = winreg.EnumKey
+_EnumValue = winreg.EnumValue
+_OpenKeyEx = winreg.OpenKeyEx
+_QueryInfoKey = winreg.QueryInfoKey
+_QueryValueEx = winreg.QueryValueEx
+
+
+@functools.lru_cache(maxsize=None)
+def _hive_from_name(name):
+    """Resolves a `HKEY_*` long name or `HK*` short name to its winreg
+    constant. Raises a KeyError if the name isn't a valid hive name."""
+    if name.startswith('HKEY_'):
+        try:
+            return getattr(winreg, name)
+        except AttributeError:
+            raise KeyError(name)
 
     for key in dir(winreg):
         if key.startswith('HKEY_'):
-            # Add the long names
-            key_map[key] = getattr(winreg, key)
-            # Add the winreg value so we can lookup nice names for keys
-            key_map[getattr(winreg, key)] = key
             # Generate shortnames
             short = 'HK' + ''.join([s[0] for s in key.split('_')[1:]])
-            if short not in key_map:
-                key_map[short] = key_map[key]
-    return key_map
+            if short == name:
+                return getattr(winreg, key)
+    raise KeyError(name)
 
 
-key_map = _generate_key_map()
-
-"""Stores commonly looked up locations in the registry."""
-REG_LOCATIONS = {
-    "system": {
-        "classes": (winreg.HKEY_LOCAL_MACHINE, 'Software\\Classes'),
-        "env_var": (
-            winreg.HKEY_LOCAL_MACHINE,
-            'SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Environment',
-        ),
-        "uninstall": (
-            winreg.HKEY_LOCAL_MACHINE,
-            'Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall',
-        ),
-    },
-    "user": {
-        "classes": (winreg.HKEY_CURRENT_USER, 'Software\\Classes'),
-        "env_var": (winreg.HKEY_CURRENT_USER, 'Environment'),
-    },
+# Wow64 access flags by architecture, any other value falls back to 0.
+_SAM_BY_ARCHITECTURE = {
+    32: winreg.KEY_WOW64_32KEY,
+    64: winreg.KEY_WOW64_64KEY,
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _hive_names():
+    """Map of winreg.HKEY_* constants to nice names, built on first use."""
+    return {getattr(winreg, key): key for key in dir(winreg) if key.startswith('HKEY_')}
+
+
 class RegKey(object):
+    # When a `pin_write_handles` scope is active this holds the write handles
+    # opened during the scope, keyed by key location. Otherwise it is None.
+    _pinned_write_handles = None
+
     def __init__(self, key, sub_key=None, computer_name=None, architecture=64):
+        # Cached read-only and write handles, opened on first use by `_key`.
+        # Assigned before any parsing so `__del__` works even if the key
+        # arguments turn out to be invalid.
+        self._handle = None
+        self._write_handle = None
+
         # If sub_key is not passed, it must be part of key
         if sub_key is None:
             key, sub_key = key.split('\\', 1)
 
         # Convert key strings into winreg keys
-        if isinstance(key, six.string_types):
-            key = key.upper()
-            key = key_map[key]
+        if isinstance(key, str):
+            key = _hive_from_name(key.upper())
 
         self.architecture = architecture
         self.computer_name = computer_name
@@ -63,20 +79,68 @@ class RegKey(object):
         self.sub_key = sub_key
 
     def __str__(self):
-        return 'RegKey({!r}, {!r}, {!r}, {})'.format(
-            key_map.get(self.key, self.key),
-            self.sub_key,
-            self.computer_name,
-            self.architecture,
+        hive = _hive_names().get(self.key, self.key)
+        return (
+            f'RegKey({hive!r}, {self.sub_key!r}, '
+            f'{self.computer_name!r}, {self.architecture})'
         )
 
     def _key(self, write=False, create=False, delete=False):
         """Returns a winreg.OpenKeyEx or None.
 
+        Read-only and plain write handles are opened once and cached on the
+        instance so repeated entry access doesn't re-open the key for every
+        call. Call `close` to release the cached handles. Handles opened for
+        create access are not cached and must be closed by the caller, unless
+        a `pin_write_handles` scope is active.
+
         Returns:
             A winreg handle object
         """
-        connection = winreg.ConnectRegistry(None, self.key)
+        return self._key_owned(write=write, create=create)[0]
+
+    def _key_owned(self, write=False, create=False):
+        """Returns a (handle, owned) pair for this key.
+
+        Owned handles must be closed by the caller. Cached read and write
+        handles and handles pinned by an active `pin_write_handles` scope are
+        not owned.
+        """
+        if not (write or create):
+            if self._handle is None:
+                self._handle = self._open(write, create)
+            return self._handle, False
+
+        pinned = RegKey._pinned_write_handles
+        if pinned is None:
+            if create:
+                return self._open(write, create), True
+
+            # Write handles are cached on the instance like read handles so
+            # repeated mutations don't re-open the key per call.
+            if self._write_handle is None:
+                self._write_handle = self._open(write, create)
+            return self._write_handle, False
+
+        pin_key = (
+            self.key,
+            self.sub_key,
+            self.computer_name,
+            self.architecture,
+            write,
+            create,
+        )
+        handle = pinned.get(pin_key)
+        if handle is None:
+            handle = self._open(write, create)
+            if handle is not None:
+                pinned[pin_key] = handle
+        return handle, False
+
+    def _open(self, write, create):
+        """Opens a new handle for this key, returning None if it doesn't
+        exist."""
+        connection = _ConnectRegistry(None, self.key)
         sam = self._sam(self.architecture)
         access = winreg.KEY_READ
         if write:
@@ -85,21 +149,84 @@ class RegKey(object):
         if create:
             func = winreg.CreateKeyEx
         else:
-            func = winreg.OpenKeyEx
+            func = _OpenKeyEx
 
         try:
             return func(connection, self.sub_key, 0, access | sam)
         except OSError:
             return None
 
+    @contextmanager
+    def _open_context(self, write=False, create=False):
+        """Context manager yielding an open handle for this key, or None if
+        the key doesn't exist.
+
+        Cached read handles and pinned write handles are left open. Handles
+        owned by this context are closed when it exits so they aren't leaked.
+        """
+        handle, owned = self._key_owned(write=write, create=create)
+        try:
+            yield handle
+        finally:
+            if owned and handle is not None:
+                _CloseKey(handle)
+
+    @classmethod
+    @contextmanager
+    def pin_write_handles(cls):
+        """Context manager that reuses write handles for batched writes.
+
+        While active, handles opened for write access are kept in a
+        class-level dict keyed by key location instead of being closed after
+        each use, so several modifications of the same key only open it once.
+        All pinned handles are closed when the outermost scope exits.
+        """
+        if cls._pinned_write_handles is not None:
+            # A scope is already active, let it own the pinned handles
+            yield
+            return
+
+        cls._pinned_write_handles = {}
+        try:
+            yield
+        finally:
+            pinned = cls._pinned_write_handles
+            cls._pinned_write_handles = None
+            for handle in pinned.values():
+                _CloseKey(handle)
+
+    def close(self):
+        """Closes the cached read and write handles if any were opened."""
+        if self._handle is not None:
+            _CloseKey(self._handle)
+            self._handle = None
+        if self._write_handle is not None:
+            _CloseKey(self._write_handle)
+            self._write_handle = None
+
+    def __del__(self):
+        self.close()
+
     @classmethod
     def _sam(cls, architecture):
         """Return the correct wow64 key for the requested architecture."""
-        if architecture == 32:
-            return winreg.KEY_WOW64_32KEY
-        elif architecture == 64:
-            return winreg.KEY_WOW64_64KEY
-        return 0
+        return _SAM_BY_ARCHITECTURE.get(architecture, 0)
+
+    @classmethod
+    def _from_parts(cls, key, sub_key, computer_name=None, architecture=64):
+        """Builds a RegKey from already resolved fields.
+
+        This assigns the fields directly, skipping the string parsing and
+        hive-name lookup done by `__init__`.
+        """
+        obj = cls.__new__(cls)
+        obj.architecture = architecture
+        obj.computer_name = computer_name
+        obj.key = key
+        obj.sub_key = sub_key
+        obj._handle = None
+        obj._write_handle = None
+        return obj
 
     def child(self, name):
         """Returns a RegKey for a sub_key with the given name.
@@ -107,39 +234,47 @@ class RegKey(object):
         Args:
             name (str): The name of the child key to return.
         """
-        cls = type(self)
-        sub_key = '{}\\{}'.format(self.sub_key, name)
-        return cls(
+        return type(self)._from_parts(
+            self.key,
+            f'{self.sub_key}\\{name}',
+            computer_name=self.computer_name,
+            architecture=self.architecture,
+        )
+
+    def clone(self):
+        """Returns a new RegKey for the same location as this one.
+
+        This copies the already resolved fields directly, skipping the string
+        parsing and hive-name lookup done by `__init__`.
+        """
+        return type(self)._from_parts(
             self.key,
-            sub_key=sub_key,
+            self.sub_key,
             computer_name=self.computer_name,
             architecture=self.architecture,
         )
 
     def child_names(self):
         """Generator returning the name for all sub_keys of this key."""
-        reg_key = self._key()
-        if not reg_key:
-            return
-
-        index = 0
-        while True:
-            try:
-                yield winreg.EnumKey(reg_key, index)
-                index += 1
-            except OSError:
-                break
+        with self._open_context() as reg_key:
+            if not reg_key:
+                return
+
+            # Enumerate using the count reported by QueryInfoKey instead of
+            # calling EnumKey until it raises to detect the end of the list.
+            # The local binding skips the global lookup per iteration.
+            enum_key = _EnumKey
+            count, _, _ = _QueryInfoKey(reg_key)
+            for index in range(count):
+                yield enum_key(reg_key, index)
 
     def create(self):
-        self._key(create=True)
+        with self._open_context(create=True):
+            pass
 
     def delete(self):
         """Delete the entire registry key. Raises a RuntimeError if the key has
         child keys."""
-        # If the key doesn't exist, there is nothing to do
-        if not self.exists():
-            return False
-
         # TODO: add recursive delete?
         for child in self.child_names():
             # We can't delete this key if it has sub-keys. Using for loop instead
@@ -148,8 +283,22 @@ class RegKey(object):
                 msg = "Unable to delete key, it has sub-keys. {}".format(self)
                 raise RuntimeError(msg)
 
+        # Release our cached handles before deleting the key, including any
+        # pinned by an active pin_write_handles scope. Otherwise a later
+        # write inside the scope would reuse a handle to the deleted key.
+        self.close()
+        pinned = RegKey._pinned_write_handles
+        if pinned is not None:
+            location = (self.key, self.sub_key, self.computer_name, self.architecture)
+            for pin_key in [k for k in pinned if k[:4] == location]:
+                _CloseKey(pinned.pop(pin_key))
+
         sam = self._sam(self.architecture)
-        winreg.DeleteKeyEx(self.key, self.sub_key, sam)
+        try:
+            winreg.DeleteKeyEx(self.key, self.sub_key, sam)
+        except FileNotFoundError:
+            # The key didn't exist, skipping a separate exists check up front
+            return False
         return True
 
     def entry(self, name=None):
@@ -163,14 +312,15 @@ class RegKey(object):
 
     def entry_names(self):
         """Generator returning the name for all entry's stored on this key."""
-        reg_key = self._key()
-        if not reg_key:
-            return
+        with self._open_context() as reg_key:
+            if not reg_key:
+                return
 
-        _, count, _ = winreg.QueryInfoKey(reg_key)
-        for index in range(count):
-            name, _, _ = winreg.EnumValue(reg_key, index)
-            yield name
+            enum_value = _EnumValue
+            _, count, _ = _QueryInfoKey(reg_key)
+            for index in range(count):
+                name, _, _ = enum_value(reg_key, index)
+                yield name
 
     def exists(self):
         """Returns True if the key exists in the registry."""
@@ -184,29 +334,39 @@ class RegEntry(object):
         self.name = name
 
     def delete(self):
-        key = self.key._key(write=True)
-        winreg.DeleteValue(key, self.name)
-        winreg.CloseKey(key)
+        with self.key._open_context(write=True) as key:
+            if key is None:
+                # Raise the same error shape DeleteValue uses for a missing
+                # value instead of passing None on as a handle.
+                raise FileNotFoundError(
+                    errno.ENOENT, 'Unable to open key for write', str(self.key)
+                )
+            winreg.DeleteValue(key, self.name)
 
     def type(self):
         """Returns the winreg value type."""
         return self.value_info()[1]
 
     def set(self, value, value_type=None):
-        key = self.key._key(write=True, create=True)
-
-        if isinstance(value_type, six.string_types):
+        if isinstance(value_type, str):
             value_type = getattr(winreg, value_type)
 
-        winreg.SetValueEx(key, self.name, 0, value_type, value)
-        winreg.CloseKey(key)
+        # Fast path: the key almost always exists already, so try a plain
+        # write open first. CreateKeyEx has to check-or-create atomically
+        # which is heavier, so only fall back to it if the open failed.
+        with self.key._open_context(write=True) as key:
+            if key is not None:
+                winreg.SetValueEx(key, self.name, 0, value_type, value)
+                return
+
+        with self.key._open_context(write=True, create=True) as key:
+            winreg.SetValueEx(key, self.name, 0, value_type, value)
         # TODO: add notify, or keep that in EnvVar?
 
     def value(self):
         """Returns the data value."""
-        value, _ = self.value_info()
         # We may need to do some conversion based on type in the future.
-        return value
+        return _QueryValueEx(self.key._key(), self.name)[0]
 
     def value_info(self):
         """Returns the entry value and value type.
@@ -215,4 +375,28 @@ class RegEntry(object):
             object: Value stored in key
             int: registry type for value. See winreg's Value Types
         """
-        return winreg.QueryValueEx(self.key._key(), self.name)
+        return _QueryValueEx(self.key._key(), self.name)
+
+
+"""Stores commonly looked up locations in the registry.
+
+The values are pre-built `RegKey` templates. Use `RegKey.clone` if you plan
+to keep the instance around so cached handles aren't shared unexpectedly.
+"""
+REG_LOCATIONS = {
+    "system": {
+        "classes": RegKey(winreg.HKEY_LOCAL_MACHINE, 'Software\\Classes'),
+        "env_var": RegKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            'SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Environment',
+        ),
+        "uninstall": RegKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            'Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall',
+        ),
+    },
+    "user": {
+        "classes": RegKey(winreg.HKEY_CURRENT_USER, 'Software\\Classes'),
+        "env_var": RegKey(winreg.HKEY_CURRENT_USER, 'Environment'),
+    },
+}
@@ -57,21 +57,301 @@ Pinning/unpinning a shortcut to the taskbar ::
     C:\>casement shortcut unpin "C:\\Users\\Public\\Desktop\\My Shortcut.lnk" -t
 """
 
+import atexit
 import errno
+import functools
 import glob
+import itertools
 import logging
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Shared per-process tempdir used to stage shortcuts for pinning, created
+# lazily by `_pin_tmpdir` and removed at interpreter exit. Staging dirs get
+# sequential names from this counter so concurrent contexts never collide.
+_pin_tmpdir_root = None
+_pin_stage_ids = itertools.count()
+
+
+def _pin_tmpdir():
+    """Returns the shared tempdir used to stage shortcuts for pinning.
+
+    Created once per process with an atexit cleanup, so batch pin updates
+    only pay for one mkdtemp and one rmtree instead of a pair per shortcut.
+    """
+    global _pin_tmpdir_root
+    if _pin_tmpdir_root is None:
+        _pin_tmpdir_root = tempfile.mkdtemp(prefix='casement-pin-')
+        atexit.register(shutil.rmtree, _pin_tmpdir_root, ignore_errors=True)
+    return _pin_tmpdir_root
+
+
+def _is_file_current(target, source):
+    """Returns True if target exists and is at least as new as source with
+    the same size, meaning a copy of source over it can be skipped."""
+    try:
+        target_info = os.stat(target)
+        source_info = os.stat(source)
+    except OSError:
+        return False
+    return (
+        target_info.st_mtime >= source_info.st_mtime
+        and target_info.st_size == source_info.st_size
+    )
+
+
+def _remove_if_file(target):
+    """Removes target if it is an existing file, returning True if removed.
+
+    A single stat covers both the exists and isfile checks. Directory
+    targets are left alone so a copy or rename can still land inside them,
+    and a missing target is not an error.
+    """
+    try:
+        mode = os.stat(target).st_mode
+    except OSError:
+        return False
+    if not stat.S_ISREG(mode):
+        return False
+    os.remove(target)
+    return True
+
+
+def _copy_file(source, target):
+    """Copies source to target, preferring the native windows copy.
+
+    win32file.CopyFile lets the file system do the copy in a single call
+    instead of shuttling the data through python-level read/write buffers
+    like shutil does, and it preserves file attributes for free.
+    """
+    if sys.platform == 'win32':
+        # Deferred import so non-windows callers can still use the fallback
+        import win32file
+
+        win32file.CopyFile(source, target, False)
+    else:
+        shutil.copy2(source, target)
+
+
+# The normalized directory structure windows uses for the User Pinned
+# directories, shared by every user profile. Built once at import so
+# `path_in_pin_dir` doesn't re-join it per call.
+_PIN_STRUCTURE = os.path.normcase(
+    os.path.join(
+        'Microsoft',
+        'Internet Explorer',
+        'Quick Launch',
+        'User Pinned',
+    )
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _pin_dirs():
+    """Returns the normalized pin directories for the current user.
+
+    These are built from %APPDATA% which doesn't change while the process is
+    running, so they are computed once and reused by `path_in_pin_dir`.
+
+    Returns:
+        app_data (str): The normalized %APPDATA% directory.
+        pin_dir (str): The User Pinned directory inside app_data.
+        start_menu_dir (str): The start menu pin directory.
+        taskbar_dir (str): The taskbar pin directory.
+    """
+    app_data = os.path.normcase(os.path.normpath(os.path.expandvars('%APPDATA%')))
+    pin_dir = os.path.join(app_data, _PIN_STRUCTURE)
+    return (
+        app_data,
+        pin_dir,
+        os.path.join(pin_dir, 'startmenu'),
+        os.path.join(pin_dir, 'taskbar'),
+    )
 
-import six
-import win32com.client
-import winshell
 
-from .app_id import AppId
+def _fast_norm(path):
+    """Normalizes a path for pin directory comparisons in a single pass.
+
+    Equivalent to normcase(normpath(path)) for the paths this module deals
+    with, but runs through the C level str.replace/rstrip/lower routines
+    instead of normpath's python level parsing. It doesn't collapse ``..``
+    components, which never appear in the shortcut paths compared here.
+    """
+    return path.replace('/', os.sep).rstrip(os.sep).lower()
+
+
+# Marks a node of the ignored-path trie as the end of an ignored prefix.
+_IGNORED_END = object()
+
+
+@functools.lru_cache(maxsize=8)
+def _ignored_trie(mount, templates):
+    """Builds a trie of path components from the ignored path templates.
+
+    The templates have ``{mount}`` formatted in and are normalized before
+    being split into components, so repeated find_shortcuts calls with the
+    same mount and ignore list skip all of the per-call string work.
+
+    Matching components through nested dicts makes the ignored check scale
+    with the depth of the candidate path instead of the number of ignored
+    prefixes, and matches whole components so ``C:\\Users\\All Users`` can't
+    accidentally claim ``C:\\Users\\All Users 2``.
+    """
+    trie = {}
+    for template in _format_paths(mount, templates):
+        prefix = os.path.normcase(os.path.normpath(template))
+        node = trie
+        for part in prefix.split(os.sep):
+            node = node.setdefault(part, {})
+        node[_IGNORED_END] = True
+    return trie
+
+
+def _in_ignored_trie(trie, norm_path):
+    """Returns True if any ignored prefix in trie covers norm_path."""
+    node = trie
+    for part in norm_path.split(os.sep):
+        if _IGNORED_END in node:
+            return True
+        node = node.get(part)
+        if node is None:
+            return False
+    return _IGNORED_END in node
+
+
+@functools.lru_cache(maxsize=256)
+def _build_pattern(path, link_name):
+    """Returns the joined glob pattern for link_name inside path.
+
+    The last character is wrapped in brackets to force glob to return the
+    on-disk case of the match (https://stackoverflow.com/a/7133137). Cached
+    so looping over mounts with the same link name reuses the strings.
+    """
+    pattern = '{}[{}]'.format(link_name[:-1], link_name[-1])
+    return os.path.join(path, pattern)
+
+
+def _has_complex_magic(path):
+    """Returns True if any component of path contains glob magic other than
+    a bare ``*``. `_expand_dir_wildcards` only expands whole-component
+    wildcards, so patterns like ``A*`` or ``Bo?`` need the glob fallback."""
+    for part in path.replace('\\', '/').split('/'):
+        if part != '*' and glob.has_magic(part):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _format_paths(mount, templates):
+    """Returns templates with ``{mount}`` formatted into each one.
+
+    Cached so repeated find_shortcuts calls with the same mount pay for the
+    format string parsing once per template, not once per call.
+    """
+    return tuple(template.format(mount=mount) for template in templates)
+
+
+# Cache of directory listings used by find_shortcuts, keyed by dirname and
+# stored with the directory's mtime so stale listings are re-scanned. A stat
+# per reuse is much cheaper than repeating the readdir.
+_DIR_CACHE = {}
+
+
+def _list_dir(dirname):
+    """Returns a list of (name, is_dir, is_file) entries for dirname, or an
+    empty list if it can't be read.
+
+    Listings are cached in `_DIR_CACHE` and revalidated with a single os.stat
+    of the directory, so repeated find_shortcuts calls skip re-enumerating
+    directories that haven't changed.
+    """
+    try:
+        mtime = os.stat(dirname).st_mtime
+    except OSError:
+        return []
+
+    cached = _DIR_CACHE.get(dirname)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    entries = []
+    try:
+        with os.scandir(dirname) as scanner:
+            for entry in scanner:
+                entries.append((entry.name, entry.is_dir(), entry.is_file()))
+    except OSError:
+        pass
+    _DIR_CACHE[dirname] = (mtime, entries)
+    return entries
+
+
+def _expand_dir_wildcards(path, memo=None):
+    """Yields the concrete directories described by ``path``.
+
+    Each bare ``*`` component is expanded using the cached directory listing
+    so only the wildcard levels are enumerated, and the yielded paths use the
+    OS-native case for the expanded components.
+
+    Several of the default search templates start with the same wildcard
+    prefix (``{mount}\\Users\\*``). Passing the same ``memo`` dict for a batch
+    of templates shares each expanded prefix between them, skipping even the
+    cache revalidation stat for prefixes that were already expanded.
+    """
+    head, sep, tail = path.partition('*')
+    if not sep:
+        yield path
+        return
+
+    base = head.rstrip('\\/')
+    tail = tail.lstrip('\\/')
+    children = memo.get(base) if memo is not None else None
+    if children is None:
+        children = [
+            os.path.join(base, name) for name, is_dir, _ in _list_dir(base) if is_dir
+        ]
+        if memo is not None:
+            memo[base] = children
+    for child in children:
+        if tail:
+            for expanded in _expand_dir_wildcards(os.path.join(child, tail), memo):
+                yield expanded
+        else:
+            yield child
+
+
+def _match_file_case(dirname, filename):
+    """Returns the OS-native cased name of filename inside dirname, or None
+    if the file doesn't exist. The compare is case-insensitive to match
+    windows filesystem behavior."""
+    lowered = filename.lower()
+    for name, _, is_file in _list_dir(dirname):
+        if name.lower() == lowered and is_file:
+            return name
+    return None
+
+
+# Maps the shell verb names used for pinning to the pin state they imply as
+# a (state_name, is_pinned) pair. A shortcut exposing an "Unpin" verb is
+# currently pinned, one exposing a "Pin" verb is not.
+_VERB_TABLE = {
+    'Pin to Start Men&u': ('start_menu', False),
+    'Unpin from Start Men&u': ('start_menu', True),
+    'Pin to Tas&kbar': ('taskbar', False),
+    'Unpin from Tas&kbar': ('taskbar', True),
+}
+
+# Normcased filenames of shortcuts that were already found to expose no
+# pinning verbs. Whether a shortcut can be pinned depends on its location
+# (for example network shares can't be pinned), so once a filename failed
+# we can skip the COM verb enumeration and re-raise immediately.
+_unpinnable_filenames = set()
 
 
 class Shortcut(object):
@@ -87,9 +367,21 @@ class Shortcut(object):
     default_ignored_paths = ('{mount}\\Users\\All Users',)
     """ Paths the find_shortcuts classmethod ignores by default. """
 
+    # Cached Shell.Application COM objects shared by all instances. COM
+    # activation is expensive, so each is created once on first use. The
+    # storage is thread-local because COM objects are bound to the apartment
+    # of the thread that created them.
+    _shell_local = threading.local()
+
     def __init__(self, filename):
         self.dirname = os.path.dirname(filename)
         self.basename = os.path.basename(filename)
+        # Cached (filename, os.stat result) most recently seen by `_stat`.
+        self._stat_cache = None
+        # Cached list of shell verbs enumerated by `file_verbs` and the
+        # {name: verb} dict `_verb_map` builds from it.
+        self._verbs_cache = None
+        self._verb_map_cache = None
         # We can't do anything with this file if it doesn't exist.
         self._exists()
 
@@ -101,10 +393,24 @@ class Shortcut(object):
         except WindowsError:
             # the shortcut can not be pinned, copy it to a tempdir
             self._dirname_backup = self.dirname
-            dirname = tempfile.mkdtemp()
-            shutil.copy2(os.path.join(self._dirname_backup, self.basename), dirname)
+            # Stage inside the shared process tempdir. The copy has to keep
+            # its basename (the shell verbs use it), so each context gets a
+            # cheap numbered sub directory instead of a full mkdtemp.
+            dirname = os.path.join(_pin_tmpdir(), str(next(_pin_stage_ids)))
+            os.mkdir(dirname)
+            source = os.path.join(self._dirname_backup, self.basename)
+            target = os.path.join(dirname, self.basename)
+            try:
+                # A hard link avoids copying the file contents entirely. This
+                # only works if the tempdir is on the same volume as the
+                # shortcut, so fall back to a real copy if linking fails.
+                os.link(source, target)
+            except OSError:
+                _copy_file(source, target)
             # Update the class so it uses the tempdir until we exit
             self.dirname = dirname
+            self._invalidate_verbs()
+            self._stat_cache = None
             # This will raise a WindowsError if we still can't pin the shortcut.
             # This could happen if tempfile is configured to use a network location.
             start_menu, taskbar = self.is_pinned()
@@ -113,17 +419,139 @@ class Shortcut(object):
     def __exit__(self, type, value, traceback):
         """Remove the tempfile and restore the dirname"""
         if self._dirname_backup is not None:
-            # If we copied the shortcut locally cleanup the temp files and reset
-            shutil.rmtree(self.dirname)
+            # If we copied the shortcut locally cleanup the staged copy and
+            # reset. Only this context's file and numbered directory are
+            # removed, the shared tempdir is cleaned up at process exit.
+            try:
+                os.remove(os.path.join(self.dirname, self.basename))
+                os.rmdir(self.dirname)
+            except OSError:
+                pass
             self.dirname = self._dirname_backup
             self._dirname_backup = None
+            self._invalidate_verbs()
+            self._stat_cache = None
 
-    def _exists(self):
-        """Raises a WindowsError if self.filename does not exist."""
-        if not os.path.isfile(self.filename):
+    def _stat(self):
+        """Returns the os.stat result for filename, cached per filename.
+
+        Repeated checks for the same location cost a dict compare instead of
+        a stat syscall, which matters when the shortcut lives on a network
+        share. Changing `dirname` or `basename` naturally invalidates the
+        cache, and the context manager drops it when swapping directories.
+
+        Raises:
+            WindowsError: Raised as ``errno.ENOENT`` if the file is missing.
+        """
+        filename = self.filename
+        if self._stat_cache is not None and self._stat_cache[0] == filename:
+            return self._stat_cache[1]
+
+        try:
+            info = os.stat(filename)
+        except OSError:
             # We can't get the verb of a file that does not exist on disk.
             msg = 'No such file'
-            raise WindowsError(errno.ENOENT, msg, self.filename)
+            raise WindowsError(errno.ENOENT, msg, filename)
+        self._stat_cache = (filename, info)
+        return info
+
+    def _exists(self):
+        """Raises a WindowsError if self.filename does not exist."""
+        self._stat()
+
+    @classmethod
+    def _shell(cls):
+        """Returns the Shell.Application COM object for the calling thread.
+
+        The object is created lazily and cached per thread, amortizing the
+        COM activation cost across the several verb enumerations a pin
+        operation performs.
+        """
+        shell = getattr(cls._shell_local, 'app', None)
+        if shell is None:
+            # Deferred import, only the COM verb access requires pywin32 and
+            # importing win32com.client is expensive.
+            import win32com.client
+
+            shell = win32com.client.Dispatch('Shell.Application')
+            cls._shell_local.app = shell
+        return shell
+
+    def _invalidate_verbs(self):
+        """Drops the cached verb list and map so `file_verbs` re-enumerates."""
+        self._verbs_cache = None
+        self._verb_map_cache = None
+
+    def _verb_map(self):
+        """Returns a dict of the verbs exposed for filename keyed by verb
+        name, built from a single enumeration.
+
+        Each verb.Name read is a COM property access, so building the map
+        once and sharing it between `is_pinned`, `_pin_verbs` and `_run_verb`
+        reads every name exactly once per enumeration. The map is cached on
+        the instance and dropped with the verb list by `_invalidate_verbs`.
+        """
+        if self._verb_map_cache is None:
+            self._verb_map_cache = {verb.Name: verb for verb in self.file_verbs()}
+        return self._verb_map_cache
+
+    def _pin_verbs(self):
+        """Returns a dict of the pinning verbs exposed for filename, keyed by
+        verb name, built from a single verb enumeration."""
+        verbs = self._verb_map()
+        return {name: verbs[name] for name in _VERB_TABLE if name in verbs}
+
+    def apply_pin_state(self, start_menu=None, taskbar=None):
+        """Pin or unpin this shortcut using as few verb enumerations as we can.
+
+        For each location, True pins the shortcut (unpinning it first if it is
+        already pinned so windows picks up any changes), False unpins it and
+        None leaves it alone. Checking with `is_pinned` and then calling the
+        pin/unpin methods each enumerate the shell verbs over COM; this does
+        the check and the first verb run from one enumeration, only
+        re-enumerating after a verb invalidates the list.
+
+        Args:
+            start_menu (bool, optional): Desired start menu pin state.
+            taskbar (bool, optional): Desired taskbar pin state.
+
+        Raises:
+            WindowsError: If no pinning verbs were found for ``self.filename``,
+                this error is raised as ``errno.EPERM``.
+        """
+        verbs = self._pin_verbs()
+        if not verbs:
+            msg = "Shortcut does not support pinning"
+            raise WindowsError(errno.EPERM, msg, self.filename)
+
+        refresh = False
+        for want, pin_name, unpin_name, label in (
+            (start_menu, 'Pin to Start Men&u', 'Unpin from Start Men&u', 'start menu'),
+            (taskbar, 'Pin to Tas&kbar', 'Unpin from Tas&kbar', 'taskbar'),
+        ):
+            if want is None:
+                continue
+            if refresh:
+                # Running a verb swaps the pin/unpin verbs, re-enumerate
+                verbs = self._pin_verbs()
+                refresh = False
+            unpin = verbs.get(unpin_name)
+            if unpin is not None:
+                logging.debug('Un-pining "{}" from {}'.format(self.basename, label))
+                unpin.DoIt()
+                self._invalidate_verbs()
+                refresh = True
+            if want:
+                if refresh:
+                    verbs = self._pin_verbs()
+                    refresh = False
+                pin = verbs.get(pin_name)
+                if pin is not None:
+                    logging.debug('Pining "{}" to {}'.format(self.basename, label))
+                    pin.DoIt()
+                    self._invalidate_verbs()
+                    refresh = True
 
     def _run_verb(self, verb_name):
         """Run the verb with this name.
@@ -135,16 +563,30 @@ class Shortcut(object):
         Returns:
             bool: If the verb was found and run.
         """
-        for verb in self.file_verbs():
-            if verb.Name == verb_name:
-                verb.DoIt()
-                return True
-        return False
+        verb = self._verb_map().get(verb_name)
+        if verb is None:
+            return False
+
+        verb.DoIt()
+        self._invalidate_verbs()
+        return True
 
     @staticmethod
     def clear_icon_cache():
-        """Triggers a clearing of the windows explorer icon cache."""
-        subprocess.Popen(['ie4uinit.exe', '-ClearIconCache'])
+        """Triggers a clearing of the windows explorer icon cache.
+
+        The refresh is fire and forget: the child is fully detached with no
+        console window and no inherited handles, so it keeps running if the
+        parent exits and the leaked Popen object holds nothing open.
+        """
+        subprocess.Popen(
+            ['ie4uinit.exe', '-ClearIconCache'],
+            creationflags=(subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
 
     def copy(self, target):
         """Copy this shortcut to/over the target.
@@ -166,26 +608,27 @@ class Shortcut(object):
                 user, this error is raised as ``errno.EPERM``. Pinned paths can
                 only be modified for the current user.
         """
-        if not os.path.exists(self.filename):
+        # A single stat checks the source exists and warms the cache the
+        # later _exists calls reuse.
+        self._stat_cache = None
+        try:
+            self._stat()
+        except WindowsError:
             raise IOError('Source link does not exist: "{}"'.format(self.filename))
 
         is_start_menu, is_taskbar = self.path_in_pin_dir(target)
-        # We are copying to the user's pinned folder, don't copy the link, pin it.
-        start_menu, taskbar = self.is_pinned()
-        if is_start_menu:
-            # If currently pinned, unpin it then re-pin it
-            if start_menu:
-                self.unpin_from_start_menu()
-            self.pin_to_start_menu()
-        elif is_taskbar:
-            if taskbar:
-                self.unpin_from_taskbar()
-            self.pin_to_taskbar()
+        if is_start_menu or is_taskbar:
+            # We are copying to the user's pinned folder, don't copy the link,
+            # pin it. Re-pinning if already pinned so the shortcut is updated.
+            self.apply_pin_state(
+                start_menu=True if is_start_menu else None,
+                taskbar=True if is_taskbar else None,
+            )
         else:
-            # Otherwise just copy the file using the file system
-            if os.path.isfile(target):
-                logging.debug('Removing existing {}'.format(target))
-                os.remove(target)
+            # Otherwise just copy the file using the file system. Removing an
+            # existing file target takes a single stat and skips directories.
+            if _remove_if_file(target):
+                logging.debug('Removed existing {}'.format(target))
             logging.debug('Copying {} -> {}'.format(self.filename, target))
             shutil.copy2(self.filename, target)
 
@@ -240,6 +683,10 @@ class Shortcut(object):
                 to control if the auto-generated path is for the desktop or start menu.
             app_id (str, optional): Whether to set app ID on shortcut or not
         """
+        # Deferred import, only create requires winshell and importing it
+        # pulls in pywin32's COM machinery.
+        import winshell
+
         if isinstance(path, (list, tuple)):
             base = path[0]
             if base in ('start menu', 'start-menu'):
@@ -284,7 +731,10 @@ class Shortcut(object):
             basename, extension = os.path.splitext(icon_source)
             ico = basename + '.ico'
             if os.path.exists(ico):
-                shutil.copyfile(ico, output)
+                if not _is_file_current(output, ico):
+                    # Skip the copy if output is already up to date, batch
+                    # creating shortcuts that share an icon does no extra I/O
+                    shutil.copyfile(ico, output)
             else:
                 from PIL import Image
 
@@ -299,7 +749,7 @@ class Shortcut(object):
         description = description[:259]
 
         # If args is a list, convert it to a string using subprocess
-        if not isinstance(args, six.string_types):
+        if not isinstance(args, str):
             args = subprocess.list2cmdline(args)
 
         kwargs = dict(
@@ -314,6 +764,9 @@ class Shortcut(object):
         winshell.CreateShortcut(shortcut, target, **kwargs)
 
         if app_id:
+            # Deferred import, AppId pulls in ctypes and pywin32's propsys
+            from .app_id import AppId
+
             AppId.set_for_shortcut(shortcut, app_id)
 
         # Attempt to clear the windows icon cache so icon changes are displayed now
@@ -325,14 +778,111 @@ class Shortcut(object):
         return os.path.join(self.dirname, self.basename)
 
     def file_verbs(self):
-        """Iterator of the verbs windows exposes for filename."""
-        obj_shell = win32com.client.Dispatch('Shell.Application')
-        folder = obj_shell.Namespace(self.dirname)
+        """Iterator of the verbs windows exposes for filename.
+
+        The verbs are enumerated over COM once and cached on the instance.
+        Running a verb changes which verbs windows exposes, so anything that
+        calls ``DoIt`` (or changes ``dirname``) calls `_invalidate_verbs` to
+        force the next call to re-enumerate.
+        """
+        if self._verbs_cache is not None:
+            return iter(self._verbs_cache)
+
+        folder = self._shell().Namespace(self.dirname)
         item = folder.ParseName(self.basename)
         # It's possible that the file was removed.
         self._exists()
-        for verb in item.Verbs():
-            yield verb
+        self._verbs_cache = list(item.Verbs())
+        return iter(self._verbs_cache)
+
+    @classmethod
+    def _path_searcher(cls, link_name, mount, ignored_paths):
+        """Returns a function that searches one formatted path template.
+
+        The returned function takes a formatted path and returns its
+        ``(links, ignored)`` lists. The expensive per-call state, the ignored
+        trie and the wildcard expansion memo, is captured once and shared by
+        every template the function is called with.
+        """
+        has_magic = glob.has_magic(link_name)
+        ignored_trie = _ignored_trie(mount, tuple(ignored_paths))
+        # Shares wildcard prefix expansions between the path templates
+        expand_memo = {}
+
+        def search(path):
+            if has_magic or _has_complex_magic(path):
+                # Complex patterns fall back to glob.glob; the scandir based
+                # expansion below only handles bare * directory components.
+                found = glob.glob(_build_pattern(path, link_name))
+            else:
+                # The common case: an exact filename. Expand only the wildcard
+                # directory levels and check for the file directly instead of
+                # paying for glob's fnmatch pass over every directory entry.
+                # _match_file_case returns the OS-native case of the name.
+                found = []
+                for dirname in _expand_dir_wildcards(path, expand_memo):
+                    name = _match_file_case(dirname, link_name)
+                    if name:
+                        found.append(os.path.join(dirname, name))
+
+            path_links = []
+            path_ignored = []
+            for f in found:
+                f_norm = os.path.normcase(os.path.normpath(f))
+                if _in_ignored_trie(ignored_trie, f_norm):
+                    path_ignored.append(f)
+                    continue
+                path_links.append(f)
+            return path_links, path_ignored
+
+        return search
+
+    @classmethod
+    def iter_shortcuts(
+        cls,
+        link_name,
+        mount='C:',
+        paths=default_paths,
+        ignored_paths=default_ignored_paths,
+        parallel=True,
+    ):
+        """Generator of (filename, is_ignored) pairs for matching shortcuts.
+
+        This streams matches as each search path finishes instead of waiting
+        for the full search like `find_shortcuts`, dropping the time to first
+        result to the fastest path's scan. Results follow completion order
+        rather than the template order, duplicates from overlapping templates
+        are dropped keeping the first one seen. The arguments match
+        `find_shortcuts`.
+        """
+        search = cls._path_searcher(link_name, mount, ignored_paths)
+        formatted = _format_paths(mount, tuple(paths))
+        seen = set()
+
+        def emit(path_links, path_ignored):
+            for f in path_links:
+                f_norm = os.path.normcase(f)
+                if f_norm not in seen:
+                    seen.add(f_norm)
+                    yield f, False
+            for f in path_ignored:
+                f_norm = os.path.normcase(f)
+                if f_norm not in seen:
+                    seen.add(f_norm)
+                    yield f, True
+
+        if parallel and len(formatted) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(formatted))) as pool:
+                futures = [pool.submit(search, path) for path in formatted]
+                for future in as_completed(futures):
+                    path_links, path_ignored = future.result()
+                    for result in emit(path_links, path_ignored):
+                        yield result
+        else:
+            for path in formatted:
+                path_links, path_ignored = search(path)
+                for result in emit(path_links, path_ignored):
+                    yield result
 
     @classmethod
     def find_shortcuts(
@@ -341,6 +891,7 @@ class Shortcut(object):
         mount='C:',
         paths=default_paths,
         ignored_paths=default_ignored_paths,
+        parallel=True,
     ):
         """Find shortcuts with a given name in known locations.
 
@@ -358,19 +909,38 @@ class Shortcut(object):
             ignored_paths (list, optional): A list of folder paths that should be
                 ignored if any shortcuts are found in them. On windows 7 there are a few
                 paths that are found when globing that don't actually exist.
+            parallel (bool, optional): Search the paths concurrently with a
+                small thread pool. Pass False to search them serially, for
+                example when calling from a thread-sensitive host.
         """
-        # Force glob to get the correct case of the link on windows.
-        # https://stackoverflow.com/a/7133137
-        link_name = '{}[{}]'.format(link_name[:-1], link_name[-1])
+        search = cls._path_searcher(link_name, mount, ignored_paths)
+        formatted = _format_paths(mount, tuple(paths))
+        if parallel and len(formatted) > 1:
+            # The search is dominated by file system waits which release the
+            # GIL, so overlap the paths with a small thread pool. map keeps
+            # the results in template order.
+            with ThreadPoolExecutor(max_workers=min(8, len(formatted))) as pool:
+                results = list(pool.map(search, formatted))
+        else:
+            results = [search(path) for path in formatted]
+
+        # Overlapping templates can find the same shortcut more than once.
+        # Dedupe with a seen set, keeping the first occurrence so the
+        # template ordering of the results is preserved.
         links = []
         ignored = []
-        for path in paths:
-            path = path.format(mount=mount)
-            for f in glob.glob(os.path.join(path, link_name)):
-                if [i for i in ignored_paths if i in f]:
+        seen = set()
+        for path_links, path_ignored in results:
+            for f in path_links:
+                f_norm = os.path.normcase(f)
+                if f_norm not in seen:
+                    seen.add(f_norm)
+                    links.append(f)
+            for f in path_ignored:
+                f_norm = os.path.normcase(f)
+                if f_norm not in seen:
+                    seen.add(f_norm)
                     ignored.append(f)
-                    continue
-                links.append(f)
         return links, ignored
 
     def is_pinned(self):
@@ -385,27 +955,70 @@ class Shortcut(object):
             WindowsError: If no pinning verbs were found for ``self.filename``,
                 this error is raised as ``errno.EPERM``.
         """
-        start_menu = None
-        taskbar = None
-        for verb in self.file_verbs():
-            name = verb.Name
-            if name == 'Pin to Start Men&u':
-                start_menu = False
-            elif name == 'Unpin from Start Men&u':
-                start_menu = True
-            elif name == 'Pin to Tas&kbar':
-                taskbar = False
-            elif name == 'Unpin from Tas&kbar':
-                taskbar = True
-            if start_menu is not None and taskbar is not None:
-                # Early Out: We found the info we are looking for
-                break
+        norm_filename = os.path.normcase(self.filename)
+        if norm_filename in _unpinnable_filenames:
+            # This location already failed, skip the verb enumeration.
+            msg = "Shortcut does not support pinning"
+            raise WindowsError(errno.EPERM, msg, self.filename)
+
+        # One verb enumeration builds the map, then the pin state is four
+        # dict lookups instead of string comparisons per verb.
+        verbs = self._verb_map()
+        state = {'start_menu': None, 'taskbar': None}
+        for name, (field, value) in _VERB_TABLE.items():
+            if name in verbs:
+                state[field] = value
+        start_menu = state['start_menu']
+        taskbar = state['taskbar']
         # If we didn't find any of the verbs, then we can't pin this shortcut.
         if start_menu is None or taskbar is None:
+            _unpinnable_filenames.add(norm_filename)
             msg = "Shortcut does not support pinning"
             raise WindowsError(errno.EPERM, msg, self.filename)
         return start_menu, taskbar
 
+    @classmethod
+    def is_pinned_many(cls, filenames):
+        """Returns the pin state of several shortcuts in one pass.
+
+        The filenames are grouped by directory so each shell Namespace is
+        only opened once and shared by every shortcut inside it, instead of
+        paying the COM Namespace cost per file like calling `is_pinned` in a
+        loop would.
+
+        Args:
+            filenames (iterable): The .lnk filenames to check.
+
+        Returns:
+            dict: Maps each filename to a ``(start_menu, taskbar)`` tuple,
+                or None if the shortcut exposes no pinning verbs or no
+                longer exists. Unlike `is_pinned` this does not raise for
+                un-pinnable or missing shortcuts.
+        """
+        shell = cls._shell()
+        results = {}
+        for dirname, group in itertools.groupby(
+            sorted(filenames, key=os.path.dirname), key=os.path.dirname
+        ):
+            # Namespace returns None for a missing directory and ParseName
+            # returns None for a missing file
+            folder = shell.Namespace(dirname)
+            for filename in group:
+                item = folder.ParseName(os.path.basename(filename)) if folder else None
+                if item is None:
+                    results[filename] = None
+                    continue
+                names = {verb.Name for verb in item.Verbs()}
+                state = {'start_menu': None, 'taskbar': None}
+                for name, (field, value) in _VERB_TABLE.items():
+                    if name in names:
+                        state[field] = value
+                if state['start_menu'] is None or state['taskbar'] is None:
+                    results[filename] = None
+                else:
+                    results[filename] = (state['start_menu'], state['taskbar'])
+        return results
+
     def move(self, target):
         """Move this shortcut to/over the target.
 
@@ -426,29 +1039,32 @@ class Shortcut(object):
                 user, this error is raised as ``errno.EPERM``. Pinned paths can
                 only be modified for the current user.
         """
-        if not os.path.exists(self.filename):
+        # A single stat checks the source exists and warms the cache the
+        # later _exists calls reuse.
+        self._stat_cache = None
+        try:
+            self._stat()
+        except WindowsError:
             raise IOError('Source link does not exist: "{}"'.format(self.filename))
         self.path_in_pin_dir(self.filename)
 
         is_start_menu, is_taskbar = self.path_in_pin_dir(target)
-        # We are copying to the user's pinned folder, don't copy the link, pin it.
-        start_menu, taskbar = self.is_pinned()
-        if is_start_menu:
-            # If currently pinned, unpin it then re-pin it
-            if start_menu:
-                self.unpin_from_start_menu()
-            self.pin_to_start_menu()
-        elif is_taskbar:
-            if taskbar:
-                self.unpin_from_taskbar()
-            self.pin_to_taskbar()
+        if is_start_menu or is_taskbar:
+            # We are copying to the user's pinned folder, don't copy the link,
+            # pin it. Re-pinning if already pinned so the shortcut is updated.
+            self.apply_pin_state(
+                start_menu=True if is_start_menu else None,
+                taskbar=True if is_taskbar else None,
+            )
         else:
-            # Otherwise just copy the file using the file system
-            if os.path.isfile(target):
-                logging.debug('Removing existing {}'.format(target))
-                os.remove(target)
+            # Otherwise just move the file using the file system. Removing an
+            # existing file target takes a single stat and skips directories.
+            if _remove_if_file(target):
+                logging.debug('Removed existing {}'.format(target))
             logging.debug('Renaming {} -> {}'.format(self.filename, target))
             os.rename(self.filename, target)
+            # The source no longer exists, drop its cached stat
+            self._stat_cache = None
 
     @classmethod
     def path_in_pin_dir(cls, path, current_user=True):
@@ -467,31 +1083,18 @@ class Shortcut(object):
                 passing ``False`` to the current_user argument.
         """
 
-        def normalize(path):
-            return os.path.normcase(os.path.normpath(path))
-
-        pin_structure = os.path.join(
-            'Microsoft',
-            'Internet Explorer',
-            'Quick Launch',
-            'User Pinned',
-        )
-        app_data = normalize(os.path.expandvars('%APPDATA%'))
-        pin_dir = normalize(
-            os.path.join(
-                app_data,
-                pin_structure,
-            )
-        )
-        # path could be a filename or a dirname
-        norm_dir = normalize(path)
-        if norm_dir.endswith('.lnk'):
-            norm_dir = os.path.dirname(norm_dir)
+        app_data, pin_dir, start_menu_dir, taskbar_dir = _pin_dirs()
+        # path could be a filename or a dirname. A single rpartition finds
+        # the last component and its parent, skipping the extra string scan
+        # os.path.dirname would do when stripping a .lnk name.
+        norm_path = _fast_norm(path)
+        head, _, tail = norm_path.rpartition(os.sep)
+        norm_dir = head if tail.endswith('.lnk') else norm_path
 
-        is_start_menu = norm_dir == os.path.join(pin_dir, 'startmenu')
-        is_taskbar = norm_dir == os.path.join(pin_dir, 'taskbar')
+        is_start_menu = norm_dir == start_menu_dir
+        is_taskbar = norm_dir == taskbar_dir
         is_current = norm_dir.startswith(app_data)
-        if current_user and pin_structure in path and not is_current:
+        if current_user and _PIN_STRUCTURE in norm_path and not is_current:
             msg = 'Pinned paths can only be modified for the current user'
             raise WindowsError(errno.EPERM, msg, path)
         return is_start_menu, is_taskbar
@@ -536,7 +1139,30 @@ class Shortcut(object):
 class _CLI(object):
     def __init__(self, args=None):
         self._parser = None
-        self._base_parser = ArgumentParser(
+        if args is None:
+            args = sys.argv[1:2]
+
+        # Sniff the command token directly so the base ArgumentParser is only
+        # built when we need it to report help or an error. A normal
+        # invocation then only builds the one parser its command uses.
+        command = args[0] if args else None
+        if command is None or command.startswith('-'):
+            # No command was passed, or a flag like -h/--help was passed
+            # first. This always exits: with 0 for -h/--help, or 2 for no
+            # command.
+            self._build_base_parser().parse_args(args)
+
+        if not hasattr(self, command):
+            self._build_base_parser().print_help()
+            sys.exit(1)
+
+        self.command = command
+        # use dispatch pattern to invoke method with same name
+        getattr(self, command)()
+
+    def _build_base_parser(self):
+        """Builds the parser used for the help text and command errors."""
+        parser = ArgumentParser(
             description='Pretends to be git',
             usage="casement shortcut <command> [<args>]\n\n"
             "Valid commands are:\n"
@@ -549,16 +1175,8 @@ class _CLI(object):
             "   unpin:  Un-Pin the shortcut to the current user's start menu and "
             "taskbar",
         )
-        self._base_parser.add_argument('command', help='Command to run')
-
-        args = self._base_parser.parse_args(args)
-        if not hasattr(self, args.command):
-            self._base_parser.print_help()
-            sys.exit(1)
-
-        self.command = args.command
-        # use dispatch pattern to invoke method with same name
-        getattr(self, args.command)()
+        parser.add_argument('command', help='Command to run')
+        return parser
 
     def appid(self):
         """Parse copy command line arguments"""
@@ -730,63 +1348,78 @@ class _CLI(object):
         )
 
     def run(self, args):
-        if args.command == 'list':
-            links, ignored = Shortcut.find_shortcuts(args.name, mount=args.mount)
-            if args.verbose and ignored:
-                logging.debug('---- Ignored shortcuts ----')
-                for link in ignored:
-                    logging.debug(link)
-            logging.debug('---- Found Shortcuts ----')
-            for link in links:
-                logging.info(link)
-            return True
-        elif args.command == 'appid':
-            if args.set:
-                AppId.set_for_shortcut(args.source, args.set)
-            else:
-                print(AppId.for_shortcut(args.source))
-            return True
-        elif args.command == 'create':
-            if args.source in ("desktop", "start-menu"):
-                args.source = [args.source]
-            Shortcut.create(
-                args.title,
-                args.args,
-                startin=args.startin,
-                target=args.target,
-                icon=args.icon,
-                icon_source=args.icon_source,
-                icon_filename=args.icon_filename,
-                path=args.source,
-                description=args.description,
-                common=int(args.public),
-                app_id=args.app_id,
-            )
-            return True
+        # use dispatch pattern to invoke the handler with the matching name,
+        # skipping the chain of command comparisons per invocation
+        return getattr(self, '_run_{}'.format(args.command))(args)
+
+    def _run_list(self, args):
+        links, ignored = Shortcut.find_shortcuts(args.name, mount=args.mount)
+        # Skip the per-link logging calls entirely when the level is disabled
+        if args.verbose and ignored and logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('---- Ignored shortcuts ----')
+            for link in ignored:
+                logging.debug('%s', link)
+        logging.debug('---- Found Shortcuts ----')
+        for link in links:
+            logging.info('%s', link)
+        return True
+
+    def _run_appid(self, args):
+        # Deferred import, AppId pulls in ctypes and pywin32's propsys
+        from .app_id import AppId
+
+        if args.set:
+            AppId.set_for_shortcut(args.source, args.set)
+        else:
+            print(AppId.for_shortcut(args.source))
+        return True
+
+    def _run_create(self, args):
+        if args.source in ("desktop", "start-menu"):
+            args.source = [args.source]
+        Shortcut.create(
+            args.title,
+            args.args,
+            startin=args.startin,
+            target=args.target,
+            icon=args.icon,
+            icon_source=args.icon_source,
+            icon_filename=args.icon_filename,
+            path=args.source,
+            description=args.description,
+            common=int(args.public),
+            app_id=args.app_id,
+        )
+        return True
 
+    def _run_pin(self, args):
         shortcut = Shortcut(args.source)
-        if args.command == 'pin':
-            start_menu, taskbar = shortcut.is_pinned()
-            if not (args.start_menu and args.taskbar):
-                logging.info('"{}" is pinned to:'.format(args.source))
-                logging.info('Start Menu: {}'.format(start_menu))
-                logging.info('Taskbar: {}'.format(taskbar))
-            if args.start_menu:
-                if start_menu:
-                    # unpin the item so it is updated by re-pinning it
-                    shortcut.unpin_from_start_menu()
-                shortcut.pin_to_start_menu()
-            if args.taskbar:
-                if taskbar:
-                    # unpin the item so it is updated by re-pinning it
-                    shortcut.unpin_from_taskbar()
-                shortcut.pin_to_taskbar()
-        elif args.command == 'unpin':
-            if args.start_menu:
+        start_menu, taskbar = shortcut.is_pinned()
+        if not (args.start_menu and args.taskbar):
+            # %-style args defer formatting until a record is actually emitted
+            logging.info('"%s" is pinned to:', args.source)
+            logging.info('Start Menu: %s', start_menu)
+            logging.info('Taskbar: %s', taskbar)
+        if args.start_menu:
+            if start_menu:
+                # unpin the item so it is updated by re-pinning it
                 shortcut.unpin_from_start_menu()
-            if args.taskbar:
+            shortcut.pin_to_start_menu()
+        if args.taskbar:
+            if taskbar:
+                # unpin the item so it is updated by re-pinning it
                 shortcut.unpin_from_taskbar()
-        elif args.command == 'copy':
-            shortcut.copy(args.target)
-        elif args.command == 'move':
-            shortcut.move(args.target)
+            shortcut.pin_to_taskbar()
+
+    def _run_unpin(self, args):
+        shortcut = Shortcut(args.source)
+        if args.start_menu:
+            shortcut.unpin_from_start_menu()
+        if args.taskbar:
+            shortcut.unpin_from_taskbar()
+
+    def _run_copy(self, args):
+        Shortcut(args.source).copy(args.target)
+
+    def _run_move(self, args):
+        Shortcut(args.source).move(args.target)
@@ -1,7 +1,31 @@
-import ctypes
-
 from .enums import FlashTimes
 
+_flash_window = None
+
+
+def _get_flash_window():
+    """Returns user32.FlashWindow with its prototype configured.
+
+    Setting argtypes/restype up front skips ctypes' per-call argument type
+    inference. The function is resolved once on first use so importing this
+    module stays cheap.
+    """
+    global _flash_window
+    if _flash_window is None:
+        import ctypes
+        from ctypes import wintypes
+
+        func = ctypes.windll.user32.FlashWindow
+        func.argtypes = [
+            wintypes.HWND,
+            wintypes.BOOL,
+            wintypes.UINT,
+            wintypes.DWORD,
+        ]
+        func.restype = wintypes.BOOL
+        _flash_window = func
+    return _flash_window
+
 
 def flash_window(hwnd, dw_flags=None, count=1, timeout=0):
     """Flashes the application depending on the os.
@@ -23,4 +47,4 @@ def flash_window(hwnd, dw_flags=None, count=1, timeout=0):
     if dw_flags is None:
         dw_flags = FlashTimes.FLASHW_TIMERNOFG
 
-    ctypes.windll.user32.FlashWindow(hwnd, int(dw_flags.value), count, timeout)
+    _get_flash_window()(hwnd, int(dw_flags), count, timeout)
@@ -1,12 +1,18 @@
 import os
 
+import pytest
+
 # Tests that write to the registry are disabled by default. Any test that is
-# writing to the registry should use `pytest.mark.skipif` checking the env var
-# `CASEMENT_TEST_WRITE_ENV`. It's intended that this is only enabled on the
-# github action runner, and by developers that need to modify code modifying the
-# registry and EnvVar setting/deleting features.
+# writing to the registry should use the `reg_write_skipif` decorator checking
+# the env var `CASEMENT_TEST_WRITE_ENV`. It's intended that this is only
+# enabled on the github action runner, and by developers that need to modify
+# code modifying the registry and EnvVar setting/deleting features.
 ENABLE_ENV_VAR = 'CASEMENT_TEST_WRITE_ENV'
 SKIP_ENV_VAR_WRITES = os.getenv(ENABLE_ENV_VAR) != '1'
 ENV_VAR_REASON = "To enable registry write tests, set the env var `{}` to `1`.".format(
     ENABLE_ENV_VAR
 )
+
+# Shared skip decorator so each test module doesn't rebuild the same mark.
+# The env var is only read once, above, at import time.
+reg_write_skipif = pytest.mark.skipif(SKIP_ENV_VAR_WRITES, reason=ENV_VAR_REASON)
@@ -13,17 +13,13 @@ Here are the Environment variables that are modified when write testing is enabl
 
 Note: See test_registry.py to see how testing registry keys/entries are handled.
 """
-from __future__ import absolute_import
-
 import os
 
 import pytest
-import win32api
 
 from casement.env_var import EnvVar
-from casement.registry import RegKey
 
-from . import ENV_VAR_REASON, SKIP_ENV_VAR_WRITES
+from . import reg_write_skipif
 
 TEST_VAR_NAME = 'CASEMENT_TEST_DELETE_ME_ENV_VAR'
 
@@ -31,22 +27,25 @@ TEST_VAR_NAME = 'CASEMENT_TEST_DELETE_ME_ENV_VAR'
 def env_var(var_name):
     def decorator(function):
         def wrapper(*args, **kwargs):
-            senv = EnvVar(True)
-            uenv = EnvVar(False)
+            # Shared instances reuse one registry handle per scope across
+            # every test instead of opening a fresh key per decorator call.
+            senv = EnvVar.shared(True)
+            uenv = EnvVar.shared(False)
             # Ensure the test env var is cleaned up, in case a previous test failed
-            # or was killed before the env var was removed normally.
-            if var_name in senv:
-                del senv[var_name]
-            if var_name in uenv:
-                del uenv[var_name]
+            # or was killed before the env var was removed normally. discard
+            # skips the separate membership query per variable, and the delayed
+            # scope collapses both removals into at most one broadcast (none if
+            # neither variable was set).
+            with EnvVar.delayed_broadcast():
+                senv.discard(var_name)
+                uenv.discard(var_name)
 
             ret = function(*args, **kwargs)
 
             # Ensure the variables are cleaned up after the test runs
-            if var_name in senv:
-                del senv[var_name]
-            if var_name in uenv:
-                del uenv[var_name]
+            with EnvVar.delayed_broadcast():
+                senv.discard(var_name)
+                uenv.discard(var_name)
             return ret
 
         return wrapper
@@ -59,6 +58,10 @@ def env_var(var_name):
     reason="Github Actions doesn't support short names anymore.",
 )
 def test_expand_path():
+    # Deferred import, only this test needs win32api and loading its native
+    # DLL at collection time slows down runs where the test is skipped
+    import win32api
+
     # Generate a short name path. This method needs a file that actually
     # exists on disk, and test_env_var.py is long enough to get ~'ed
     short_name = win32api.GetShortPathName(__file__)
@@ -84,41 +87,47 @@ def test_expand_path():
     assert out == __file__
 
 
-@pytest.mark.skipif(SKIP_ENV_VAR_WRITES, reason=ENV_VAR_REASON)
+@reg_write_skipif
 @env_var(TEST_VAR_NAME)
 def test_envvar_modify():
-    uenv = EnvVar(system=False)
+    uenv = EnvVar.shared(system=False)
     # Ensure the env var is not set
     assert TEST_VAR_NAME not in uenv
 
-    # Ensure the env var was set
-    uenv[TEST_VAR_NAME] = 'TEST'
-    assert uenv[TEST_VAR_NAME] == 'TEST'
-    uenv[TEST_VAR_NAME] = 'TEST 2'
-    assert uenv[TEST_VAR_NAME] == 'TEST 2'
-
-    # Test iterating over the env var. We can't tell for sure what
-    # env vars are set, but we at least know one is set at this point
-    for key, value in uenv.items():
-        if key == TEST_VAR_NAME:
-            assert value == 'TEST 2'
-            break
-    else:
-        raise AssertionError(
-            '{} was not found when iterating over the user environment'.format(
-                TEST_VAR_NAME
+    # Reads still see each change inside the delayed scope, so the whole
+    # mutation sequence only pays for a single broadcast when it exits.
+    with EnvVar.delayed_broadcast():
+        # Ensure the env var was set
+        uenv[TEST_VAR_NAME] = 'TEST'
+        assert uenv[TEST_VAR_NAME] == 'TEST'
+        uenv[TEST_VAR_NAME] = 'TEST 2'
+        assert uenv[TEST_VAR_NAME] == 'TEST 2'
+
+        # Test iterating over the env var. We can't tell for sure what
+        # env vars are set, but we at least know one is set at this point
+        for key, value in uenv.items():
+            if key == TEST_VAR_NAME:
+                assert value == 'TEST 2'
+                break
+        else:
+            raise AssertionError(
+                '{} was not found when iterating over the user environment'.format(
+                    TEST_VAR_NAME
+                )
             )
-        )
 
-    # Test length support, again we only know at least one env var is set
-    count = len(uenv)
-    assert count >= 1
+        # Test length support, again we only know at least one env var is set
+        count = len(uenv)
+        assert count >= 1
 
-    # Ensure the env var is once again not set
-    del uenv[TEST_VAR_NAME]
-    assert TEST_VAR_NAME not in uenv
+        # Ensure the env var is once again not set
+        del uenv[TEST_VAR_NAME]
+        assert TEST_VAR_NAME not in uenv
+
+    # test edge case where the registry key doesn't exist. RegKey is only
+    # used by this test so import it here instead of at collection time
+    from casement.registry import RegKey
 
-    # test edge case where the registry key doesn't exist
     bad = EnvVar(system=False)
     bad.__reg__ = RegKey('HKEY_CURRENT_USER', 'BadEnvironment')
     assert len(bad) == 0
@@ -139,7 +148,7 @@ class EnvVarPatch(EnvVar):
         cls.count += 1
 
 
-@pytest.mark.skipif(SKIP_ENV_VAR_WRITES, reason=ENV_VAR_REASON)
+@reg_write_skipif
 @env_var(TEST_VAR_NAME)
 def test_broadcast():
     """This test tests that delayed_broadcast only calls broadcast in the outer
@@ -166,7 +175,7 @@ def test_broadcast():
     assert EnvVarPatch.count == 1
 
 
-@pytest.mark.skipif(SKIP_ENV_VAR_WRITES, reason=ENV_VAR_REASON)
+@reg_write_skipif
 @env_var(TEST_VAR_NAME)
 def test_delayed_broadcast():
     """This test tests that delayed_broadcast only calls broadcast in the outer
@@ -17,17 +17,14 @@ Note: See test_env_var.py to see how testing Environment variables are handled.
 # without the need for the host to actually have these registry keys. We should
 # only enable testing of registry modifications once this is resolved.
 # Ie don't running casement tests should not modify the host registry.
-from __future__ import absolute_import
-
+import winreg
 from contextlib import contextmanager
 
 import pytest
-import six
-from six.moves import winreg
 
 from casement.registry import REG_LOCATIONS, RegKey
 
-from . import ENABLE_ENV_VAR, ENV_VAR_REASON, SKIP_ENV_VAR_WRITES
+from . import ENABLE_ENV_VAR, reg_write_skipif
 
 
 @contextmanager
@@ -39,22 +36,22 @@ def remove_reg_keys(items):
     Items is a list of registry (key, sub_key) items. If removing parents and
     children ensure the children are passed after the parents.
     """
-    items = reversed(items)
+    # Materialize the reversed order once; reversed() returns an iterator, so
+    # reusing it directly would leave the cleanup pass in finally with nothing
+    # to iterate.
+    items = tuple(reversed(items))
     for key, sub_key in items:
-        reg = RegKey(key, sub_key)
         # Ensure the registry key is removed, in case a previous test failed
-        # or was killed before the registry key was removed normally.
-        if reg.exists():
-            reg.delete()
+        # or was killed before the registry key was removed normally. delete
+        # returns False for a missing key, so no exists check is needed.
+        RegKey(key, sub_key).delete()
 
     try:
         yield
     finally:
         for key, sub_key in items:
-            reg = RegKey(key, sub_key)
             # Ensure the variables are cleaned up after the test runs
-            if reg.exists():
-                reg.delete()
+            RegKey(key, sub_key).delete()
 
 
 @pytest.mark.parametrize(
@@ -141,13 +138,13 @@ def test_entry():
     # String data type
     entry = reg.entry('PreviewTitle')
     assert entry.type() == winreg.REG_SZ
-    assert isinstance(entry.value(), six.string_types)
+    assert isinstance(entry.value(), str)
     assert entry.value() == 'prop:System.ItemNameDisplay;System.ItemTypeText'
 
     # Expanding string data type
     entry = reg.entry('FriendlyTypeName')
     assert entry.type() == winreg.REG_EXPAND_SZ
-    assert isinstance(entry.value(), six.string_types)
+    assert isinstance(entry.value(), str)
 
 
 def test_sam():
@@ -157,66 +154,70 @@ def test_sam():
     assert RegKey._sam(16) == 0
 
 
-@pytest.mark.skipif(SKIP_ENV_VAR_WRITES, reason=ENV_VAR_REASON)
+@reg_write_skipif
 def test_write():
-    key, root = REG_LOCATIONS['user']['classes']
-    root = '{}\\CASEMENT_DELETE_ME'.format(root)
+    classes = REG_LOCATIONS['user']['classes']
+    key = classes.key
+    root = '{}\\CASEMENT_DELETE_ME'.format(classes.sub_key)
     child_names = ('CASEMENT_DELETE_ME_CHILD1', 'CASEMENT_DELETE_ME_CHILD2')
     child1 = '{}\\{}'.format(root, child_names[0])
     child2 = '{}\\{}'.format(root, child_names[1])
 
     with remove_reg_keys(((key, root), (key, child1), (key, child2))):
-        reg = RegKey(key, root)
-        assert not reg.exists()
-
-        # Test deleting a key that doesn't exist
-        ret = reg.delete()
-        assert ret is False
-
-        # Test creating a new key
-        reg.create()
-        assert reg.exists()
-
-        # Ensure we raise a useful exception if trying to delete a key with a child
-        creg1 = RegKey(key, child1)
-        assert not creg1.exists()
-        creg1.create()
-        assert creg1.exists()
-        with pytest.raises(RuntimeError) as excinfo:
-            reg.delete()
-        assert str(excinfo.value).startswith("Unable to delete key")
-
-        # Test child and child_names by adding a second child
-        creg2 = reg.child(child_names[1])
-        assert not creg2.exists()
-        creg2.create()
-
-        assert set(reg.child_names()) == set(child_names)
-
-        # Test getting/setting an Entry value
-        entry_name = 'CASEMENT_DELETE_ME_ENTRY'
-        entry = creg1.entry(entry_name)
-        assert entry.key == creg1
-        assert entry.name == entry_name
-
-        value = '[%{}%]'.format(ENABLE_ENV_VAR)
-        entry.set(value, "REG_EXPAND_SZ")
-        assert entry.value() == value
-        assert entry.type() == winreg.REG_EXPAND_SZ
-        assert entry.value_info() == (value, winreg.REG_EXPAND_SZ)
-        entry.set(value, winreg.REG_SZ)
-        assert entry.value_info() == (value, winreg.REG_SZ)
-
-        # Remove the children so we can actually delete the parent
-        creg1.delete()
-        assert not creg1.exists()
-        creg2.delete()
-        assert not creg2.exists()
-
-        # Test deleting a key that exists
-        ret = reg.delete()
-        assert ret is True
-        assert not reg.exists()
-
-        # Check child_names if the key doesn't exist
-        assert not set(reg.child_names())
+        # Batch the write handle opens for the whole sequence; each key's
+        # write handle is opened once and reused for every modification.
+        with RegKey.pin_write_handles():
+            reg = RegKey(key, root)
+            assert not reg.exists()
+
+            # Test deleting a key that doesn't exist
+            ret = reg.delete()
+            assert ret is False
+
+            # Test creating a new key
+            reg.create()
+            assert reg.exists()
+
+            # Ensure we raise a useful exception if trying to delete a key with a child
+            creg1 = RegKey(key, child1)
+            assert not creg1.exists()
+            creg1.create()
+            assert creg1.exists()
+            with pytest.raises(RuntimeError) as excinfo:
+                reg.delete()
+            assert str(excinfo.value).startswith("Unable to delete key")
+
+            # Test child and child_names by adding a second child
+            creg2 = reg.child(child_names[1])
+            assert not creg2.exists()
+            creg2.create()
+
+            assert set(reg.child_names()) == set(child_names)
+
+            # Test getting/setting an Entry value
+            entry_name = 'CASEMENT_DELETE_ME_ENTRY'
+            entry = creg1.entry(entry_name)
+            assert entry.key == creg1
+            assert entry.name == entry_name
+
+            value = '[%{}%]'.format(ENABLE_ENV_VAR)
+            entry.set(value, "REG_EXPAND_SZ")
+            assert entry.value() == value
+            assert entry.type() == winreg.REG_EXPAND_SZ
+            assert entry.value_info() == (value, winreg.REG_EXPAND_SZ)
+            entry.set(value, winreg.REG_SZ)
+            assert entry.value_info() == (value, winreg.REG_SZ)
+
+            # Remove the children so we can actually delete the parent
+            creg1.delete()
+            assert not creg1.exists()
+            creg2.delete()
+            assert not creg2.exists()
+
+            # Test deleting a key that exists
+            ret = reg.delete()
+            assert ret is True
+            assert not reg.exists()
+
+            # Check child_names if the key doesn't exist
+            assert not set(reg.child_names())